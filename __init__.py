@@ -4,8 +4,8 @@ from __future__ import annotations
 import asyncio
 from datetime import timedelta
 import logging
-
-from bleak_retry_connector import BLEAK_RETRY_EXCEPTIONS as BLEAK_EXCEPTIONS
+import sys
+from typing import Any
 
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth.match import ADDRESS, BluetoothCallbackMatcher
@@ -15,8 +15,14 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DEVICE_TIMEOUT, DOMAIN, UPDATE_SECONDS
-from .model import BLEBlindData, BLEBlind
+from .const import (
+    DEVICE_TIMEOUT,
+    DOMAIN,
+    IDLE_POLLS,
+    IDLE_UPDATE_SECONDS,
+    UPDATE_SECONDS,
+)
+from .model import OPERATION_EXCEPTIONS, BLEBlindData, BLEBlind
 
 PLATFORMS: list[Platform] = [Platform.COVER]
 
@@ -25,14 +31,16 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up LED BLE from a config entry."""
-    address: str = entry.data[CONF_ADDRESS]
-    ble_device = bluetooth.async_ble_device_from_address(hass, address.upper(), True)
-    if not ble_device:
+    address: str = sys.intern(entry.data[CONF_ADDRESS].upper())
+    service_info = bluetooth.async_last_service_info(hass, address, True)
+    if not service_info:
         raise ConfigEntryNotReady(
             f"Could not find LED BLE device with address {address}"
         )
 
-    led_ble = BLEBlind(ble_device)
+    led_ble = BLEBlind(
+        service_info.device, service_info.advertisement, service_info.time
+    )
 
     @callback
     def _async_update_ble(
@@ -53,12 +61,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     )
 
+    idle_polls = 0
+
     async def _async_update():
         """Update the device state."""
+        nonlocal idle_polls
         try:
             await led_ble.update()
-        except BLEAK_EXCEPTIONS as ex:
+        except OPERATION_EXCEPTIONS as ex:
             raise UpdateFailed(str(ex)) from ex
+        if led_ble.notifying:
+            # Ticks only keep the subscribed link alive, polling stays cheap
+            if idle_polls >= IDLE_POLLS:
+                coordinator.update_interval = timedelta(seconds=UPDATE_SECONDS)
+            idle_polls = 0
+            return
+        idle_polls += 1
+        if idle_polls == IDLE_POLLS:
+            # Nothing has changed for a while, stop waking the device up
+            coordinator.update_interval = timedelta(seconds=IDLE_UPDATE_SECONDS)
+
+    @callback
+    def _async_device_activity(*_: Any) -> None:
+        """Go back to regular polling once the device is in use."""
+        nonlocal idle_polls
+        was_idle = idle_polls >= IDLE_POLLS
+        idle_polls = 0
+        if was_idle:
+            coordinator.update_interval = timedelta(seconds=UPDATE_SECONDS)
+            # The queued hourly tick keeps its schedule, refresh to replace it
+            hass.async_create_task(coordinator.async_request_refresh())
 
     startup_event = asyncio.Event()
     cancel_first_update = led_ble.register_callback(lambda *_: startup_event.set())
@@ -69,6 +101,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_method=_async_update,
         update_interval=timedelta(seconds=UPDATE_SECONDS),
     )
+    entry.async_on_unload(led_ble.register_callback(_async_device_activity))
 
     try:
         await coordinator.async_config_entry_first_refresh()
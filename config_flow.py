@@ -17,7 +17,7 @@ from homeassistant.const import CONF_ADDRESS
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import DOMAIN
-from .model import BLEBlind
+from .model import BLEBlind, EstablishConnectionError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,7 +63,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             led_ble = BLEBlind(discovery_info.device)
             try:
                 await led_ble.update()
-            except BLEAK_EXCEPTIONS:
+            except (*BLEAK_EXCEPTIONS, EstablishConnectionError):
                 errors["base"] = "cannot_connect"
                 _LOGGER.exception("Connection error")
             except Exception:  # pylint: disable=broad-except
@@ -3,6 +3,9 @@
 DOMAIN = "ble_blinds"
 DEVICE_TIMEOUT = 30
 UPDATE_SECONDS = 15
+IDLE_UPDATE_SECONDS = 3600
+IDLE_POLLS = 20
+ADVERTISEMENT_STALE_SECONDS = 600
 
 SERVICE_UUID = "346f721a-14f7-4065-8a1f-ad91e35f9bb2"
 POSITION_READ_UUID = "2f6f41e1-66af-4a09-b933-a700ea6f0c52"
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 import asyncio
+import contextlib
 import struct
+import time
 from typing import Callable
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from bleak.backends.device import BLEDevice
@@ -17,34 +19,97 @@ from bleak_retry_connector import (
 )
 from home_assistant_bluetooth import BluetoothServiceInfo
 
-from .const import POSITION_READ_UUID, UPDATE_SECONDS, SERVICE_UUID, POSITION_WRITE_UUID
+from .const import (
+    ADVERTISEMENT_STALE_SECONDS,
+    POSITION_READ_UUID,
+    UPDATE_SECONDS,
+    SERVICE_UUID,
+    POSITION_WRITE_UUID,
+)
 
 import logging
 
 class CharacteristicMissingError(Exception):
     """Raised when a characteristic is missing."""
 
+class EstablishConnectionError(Exception):
+    """Raised when connecting failed after establish_connection's retries."""
+
 DISCONNECT_DELAY = 120
 BLEAK_BACKOFF_TIME = 0.25
 RETRY_BACKOFF_EXCEPTIONS = (BleakDBusError,)
+OPERATION_EXCEPTIONS = (
+    CharacteristicMissingError,
+    EstablishConnectionError,
+    *BLEAK_EXCEPTIONS,
+)
 DEFAULT_ATTEMPTS = 3
+WRITE_COALESCE_DELAY = 0.15
+
+_POSITION_STRUCT = struct.Struct("<H")
+# Immutable write payloads for every cover percentage
+_POSITION_PAYLOADS = tuple(_POSITION_STRUCT.pack(p) for p in range(101))
 
 _LOGGER = logging.getLogger("ble_blinds")
 
 class BLEBlind:
-    def __init__(self, ble_device: BLEDevice, advertisement_data: AdvertisementData | None = None) -> None:
+    """Connection to a single blind.
+
+    One instance owns the BLE connection of a config entry and is shared
+    through BLEBlindData.device. Platforms must use that instance instead
+    of creating their own, which would open a connection per entity.
+    """
+
+    __slots__ = (
+        "_ble_device",
+        "_advertisement_data",
+        "_name",
+        "_last_advertisement",
+        "_operation_lock",
+        "_connect_lock",
+        "_position_read_char",
+        "_position_write_char",
+        "_disconnect_timer",
+        "_disconnect_deadline",
+        "_client",
+        "_expected_disconnect",
+        "_notifying",
+        "loop",
+        "_callbacks",
+        "_position",
+        "_last_payload",
+        "_pending_position",
+        "_write_task",
+    )
+
+    def __init__(
+        self,
+        ble_device: BLEDevice,
+        advertisement_data: AdvertisementData | None = None,
+        advertisement_time: float | None = None,
+    ) -> None:
         self._ble_device = ble_device
         self._advertisement_data = advertisement_data
+        self._name = ble_device.name or ble_device.address
+        # Monotonic time the advertisement was received, not when we got it
+        self._last_advertisement = (
+            time.monotonic() if advertisement_time is None else advertisement_time
+        )
         self._operation_lock = asyncio.Lock()
         self._connect_lock: asyncio.Lock = asyncio.Lock()
         self._position_read_char: BleakGATTCharacteristic | None = None
         self._position_write_char: BleakGATTCharacteristic | None = None
         self._disconnect_timer: asyncio.TimerHandle | None = None
+        self._disconnect_deadline = 0.0
         self._client: BleakClientWithServiceCache | None = None
         self._expected_disconnect = False
+        self._notifying = False
         self.loop = asyncio.get_running_loop()
-        self._callbacks: list[Callable[[int], None]] = []
+        self._callbacks: tuple[Callable[[int], None], ...] = ()
         self._position = 0
+        self._last_payload: bytes | None = None
+        self._pending_position: int | None = None
+        self._write_task: asyncio.Task[None] | None = None
 
     def set_ble_device_and_advertisement_data(
         self, ble_device: BLEDevice, advertisement_data: AdvertisementData
@@ -52,15 +117,22 @@ class BLEBlind:
         """Set the ble device."""
         self._ble_device = ble_device
         self._advertisement_data = advertisement_data
+        self._name = ble_device.name or ble_device.address
+        self._last_advertisement = time.monotonic()
 
     @property
     def position(self) -> int:
         return self._position
 
+    @property
+    def notifying(self) -> bool:
+        """Return True while position notifications are being received."""
+        return bool(self._notifying and self._client and self._client.is_connected)
+
     @property
     def name(self) -> str:
         """Get the name of the device."""
-        return self._ble_device.name or self._ble_device.address
+        return self._name
 
     @property
     def address(self) -> str:
@@ -68,9 +140,14 @@ class BLEBlind:
         return self._ble_device.address
 
     @property
-    def _address(self) -> str:
-        """Return the address."""
-        return self._ble_device.address
+    def is_stale(self) -> bool:
+        """Return True if the device has not been heard from recently."""
+        if self._client and self._client.is_connected:
+            # Connected devices usually stop advertising
+            return False
+        return (
+            time.monotonic() - self._last_advertisement > ADVERTISEMENT_STALE_SECONDS
+        )
 
     @property
     def rssi(self) -> int | None:
@@ -81,8 +158,9 @@ class BLEBlind:
 
     def _fire_callbacks(self) -> None:
         """Fire the callbacks."""
+        position = self._position
         for callback in self._callbacks:
-            callback(self._position)
+            callback(position)
 
     def register_callback(
         self, callback: Callable[[int], None]
@@ -90,21 +168,32 @@ class BLEBlind:
         """Register a callback to be called when the state changes."""
 
         def unregister_callback() -> None:
-            self._callbacks.remove(callback)
+            self._callbacks = tuple(c for c in self._callbacks if c is not callback)
 
-        self._callbacks.append(callback)
+        self._callbacks = (*self._callbacks, callback)
         return unregister_callback
 
     async def stop(self) -> None:
         _LOGGER.debug("%s: Stop", self.name)
+        # Drop queued writes so they cannot reconnect after we disconnect
+        self._pending_position = None
+        if self._write_task and not self._write_task.done():
+            self._write_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._write_task
+        self._write_task = None
         await self._execute_disconnect()
 
     def _notification_handler(self, _sender: int, data: bytearray) -> None:
         """Handle notification responses."""
-        try:
-            self._position, = struct.unpack("<H", data)
-        except Exception as e:
-            _LOGGER.exception("Failed to decode position: %s", data)
+        if data == self._last_payload:
+            # Nothing changed, skip the state writes downstream
+            return
+        self._last_payload = bytes(data)
+        if 0 < len(data) <= 2:
+            self._position = int.from_bytes(data, "little")
+        else:
+            _LOGGER.error("%s: Failed to decode position: %s", self.name, data)
 
         self._fire_callbacks()
 
@@ -113,8 +202,14 @@ class BLEBlind:
         assert self._client is not None  # nosec
         if not self._position_write_char:
             raise CharacteristicMissingError("write characteristic missing")
-        _LOGGER.debug("Writing position: %s", position)
-        await self._client.write_gatt_char(self._position_write_char, struct.pack("<H", position), True)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s: Writing position: %s", self.name, position)
+        payload = (
+            _POSITION_PAYLOADS[position]
+            if 0 <= position <= 100
+            else _POSITION_STRUCT.pack(position)
+        )
+        await self._client.write_gatt_char(self._position_write_char, payload, True)
 
     async def _read_position_locked(self) -> None:
         assert self._client is not None  # nosec
@@ -125,34 +220,48 @@ class BLEBlind:
 
     async def _ensure_connected(self) -> None:
         """Ensure connection to device is established."""
+        if self._client and self._client.is_connected:
+            self._reset_disconnect_timer()
+            return
         if self._connect_lock.locked():
             _LOGGER.debug(
                 "%s: Connection already in progress, waiting for it to complete; RSSI: %s",
                 self.name,
                 self.rssi,
             )
-        if self._client and self._client.is_connected:
-            self._reset_disconnect_timer()
-            return
         async with self._connect_lock:
             # Check again while holding the lock
             if self._client and self._client.is_connected:
                 self._reset_disconnect_timer()
                 return
             _LOGGER.debug("%s: Connecting; RSSI: %s", self.name, self.rssi)
-            client = await establish_connection(
-                BleakClientWithServiceCache,
-                self._ble_device,
-                self.name,
-                self._disconnected,
-                use_services_cache=True,
-                ble_device_callback=lambda: self._ble_device,
-            )
+            try:
+                client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    self._ble_device,
+                    self.name,
+                    self._disconnected,
+                    use_services_cache=True,
+                    ble_device_callback=lambda: self._ble_device,
+                )
+            except BleakNotFoundError:
+                raise
+            except BLEAK_EXCEPTIONS as ex:
+                # establish_connection already retried, don't retry it again
+                raise EstablishConnectionError(str(ex)) from ex
             _LOGGER.debug("%s: Connected; RSSI: %s", self.name, self.rssi)
-            resolved = self._resolve_characteristics(client.services)
-            if not resolved:
-                # Try to handle services failing to load
-                resolved = self._resolve_characteristics(await client.get_services())
+            try:
+                if not self._resolve_characteristics(client.services):
+                    # The cached services are stale, rediscover on the next attempt
+                    await client.clear_cache()
+                    raise CharacteristicMissingError(
+                        "Position characteristics missing"
+                    )
+            except (CharacteristicMissingError, BleakError):
+                # The client is not stored yet, nothing else would disconnect it
+                self._expected_disconnect = True
+                await client.disconnect()
+                raise
 
             self._client = client
             self._reset_disconnect_timer()
@@ -160,19 +269,37 @@ class BLEBlind:
             _LOGGER.debug(
                 "%s: Subscribe to notifications; RSSI: %s", self.name, self.rssi
             )
-            await client.start_notify(self._position_read_char, self._notification_handler)
+            try:
+                await client.start_notify(
+                    self._position_read_char, self._notification_handler
+                )
+            except BleakError:
+                # Keep the connection, update() falls back to polling reads
+                _LOGGER.debug(
+                    "%s: Failed to subscribe to notifications", self.name, exc_info=True
+                )
+            else:
+                self._notifying = True
 
     def _reset_disconnect_timer(self) -> None:
         """Reset disconnect timer."""
-        if self._disconnect_timer:
-            self._disconnect_timer.cancel()
         self._expected_disconnect = False
-        self._disconnect_timer = self.loop.call_later(
-            DISCONNECT_DELAY, self._disconnect
-        )
+        # Only move the deadline, the armed timer re-arms itself when it fires
+        self._disconnect_deadline = self.loop.time() + DISCONNECT_DELAY
+        if self._disconnect_timer is None:
+            self._disconnect_timer = self.loop.call_at(
+                self._disconnect_deadline, self._disconnect
+            )
 
     def _disconnected(self, client: BleakClientWithServiceCache) -> None:
         """Disconnected callback."""
+        if self._client is client:
+            # Drop the dead client so the next operation reconnects
+            self._client = None
+            self._notifying = False
+            # Handles belong to the old connection's service collection
+            self._position_read_char = None
+            self._position_write_char = None
         if self._expected_disconnect:
             _LOGGER.debug(
                 "%s: Disconnected from device; RSSI: %s", self.name, self.rssi
@@ -186,25 +313,36 @@ class BLEBlind:
 
     def _disconnect(self) -> None:
         """Disconnect from device."""
+        if self.loop.time() < self._disconnect_deadline:
+            self._disconnect_timer = self.loop.call_at(
+                self._disconnect_deadline, self._disconnect
+            )
+            return
         self._disconnect_timer = None
-        asyncio.create_task(self._execute_timed_disconnect())
-
-    async def _execute_timed_disconnect(self) -> None:
-        """Execute timed disconnection."""
-        _LOGGER.debug(
-            "%s: Disconnecting after timeout of %s",
-            self.name,
-            DISCONNECT_DELAY,
+        if not (self._client and self._client.is_connected):
+            return
+        self.loop.create_task(
+            self._execute_disconnect(timed=True),
+            name=f"ble_blinds disconnect {self.address}",
         )
-        await self._execute_disconnect()
 
-    async def _execute_disconnect(self) -> None:
+    async def _execute_disconnect(self, timed: bool = False) -> None:
         """Execute disconnection."""
+        if timed:
+            _LOGGER.debug(
+                "%s: Disconnecting after timeout of %s",
+                self.name,
+                DISCONNECT_DELAY,
+            )
+        if self._disconnect_timer:
+            self._disconnect_timer.cancel()
+            self._disconnect_timer = None
         async with self._connect_lock:
             position_read_char = self._position_read_char
             client = self._client
             self._expected_disconnect = True
             self._client = None
+            self._notifying = False
             self._position_read_char = None
             self._position_write_char = None
             if client and client.is_connected:
@@ -217,106 +355,77 @@ class BLEBlind:
                         )
                 await client.disconnect()
 
-    async def _get_position(
-        self, retry: int | None = None
-    ) -> None:
-        """Send command to device and read response."""
-        await self._ensure_connected()
-        await self._get_position_while_connected( retry)
-
-    async def _set_position(
-        self, position: int, retry: int | None = None
-    ) -> None:
-        """Send command to device and read response."""
-        await self._ensure_connected()
-        await self._set_position_while_connected(position, retry)
-
-    async def _get_position_while_connected(
-        self, retry: int | None = None
-    ) -> None:
+    async def _get_position(self) -> None:
         """Send command to device and read response."""
-        _LOGGER.debug(
-            "%s: getting position",
-            self.name,
-        )
-        if self._operation_lock.locked():
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "%s: Operation already in progress, waiting for it to complete; RSSI: %s",
+                "%s: getting position",
                 self.name,
-                self.rssi,
             )
-        async with self._operation_lock:
-            try:
-                await self._get_position_locked()
-                return
-            except BleakNotFoundError:
-                _LOGGER.error(
-                    "%s: device not found, no longer in range, or poor RSSI: %s",
-                    self.name,
-                    self.rssi,
-                    exc_info=True,
-                )
-                raise
-            except CharacteristicMissingError as ex:
+            if self._operation_lock.locked():
                 _LOGGER.debug(
-                    "%s: characteristic missing: %s; RSSI: %s",
+                    "%s: Operation already in progress, waiting for it to complete; RSSI: %s",
                     self.name,
-                    ex,
                     self.rssi,
-                    exc_info=True,
                 )
+        async with self._operation_lock:
+            try:
+                await self._get_position_locked()
+            except OPERATION_EXCEPTIONS as ex:
+                self._log_operation_error(ex)
                 raise
-            except BLEAK_EXCEPTIONS:
-                _LOGGER.debug("%s: communication failed", self.name, exc_info=True)
-                raise
-
-        raise RuntimeError("Unreachable")
 
-    async def _set_position_while_connected(
-        self, position: int, retry: int | None = None
-    ) -> None:
+    async def _set_position(self, position: int) -> None:
         """Send command to device and read response."""
-        _LOGGER.debug(
-            "%s: setting position %s",
-            self.name,
-            position,
-        )
-        if self._operation_lock.locked():
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "%s: Operation already in progress, waiting for it to complete; RSSI: %s",
+                "%s: setting position %s",
                 self.name,
-                self.rssi,
+                position,
             )
-        async with self._operation_lock:
-            try:
-                await self._set_position_locked(position)
-                return
-            except BleakNotFoundError:
-                _LOGGER.error(
-                    "%s: device not found, no longer in range, or poor RSSI: %s",
-                    self.name,
-                    self.rssi,
-                    exc_info=True,
-                )
-                raise
-            except CharacteristicMissingError as ex:
+            if self._operation_lock.locked():
                 _LOGGER.debug(
-                    "%s: characteristic missing: %s; RSSI: %s",
+                    "%s: Operation already in progress, waiting for it to complete; RSSI: %s",
                     self.name,
-                    ex,
                     self.rssi,
-                    exc_info=True,
                 )
-                raise
-            except BLEAK_EXCEPTIONS:
-                _LOGGER.debug("%s: communication failed", self.name, exc_info=True)
+        async with self._operation_lock:
+            try:
+                await self._set_position_locked(position)
+            except OPERATION_EXCEPTIONS as ex:
+                self._log_operation_error(ex)
                 raise
 
-        raise RuntimeError("Unreachable")
+    def _log_operation_error(self, ex: Exception) -> None:
+        """Log why a read or write ultimately failed."""
+        if isinstance(ex, BleakNotFoundError):
+            _LOGGER.error(
+                "%s: device not found, no longer in range, or poor RSSI: %s",
+                self.name,
+                self.rssi,
+                exc_info=True,
+            )
+        elif isinstance(ex, EstablishConnectionError):
+            _LOGGER.warning(
+                "%s: Failed to connect: %s; RSSI: %s", self.name, ex, self.rssi
+            )
+        elif isinstance(ex, CharacteristicMissingError):
+            _LOGGER.debug(
+                "%s: characteristic missing: %s; RSSI: %s",
+                self.name,
+                ex,
+                self.rssi,
+                exc_info=True,
+            )
+        else:
+            _LOGGER.debug("%s: communication failed", self.name, exc_info=True)
 
     @retry_bluetooth_connection_error(DEFAULT_ATTEMPTS)
     async def _set_position_locked(self, position: int) -> None:
         """Send command to device and read response."""
+        # Reconnects when an earlier attempt dropped the link, connection
+        # failures raise EstablishConnectionError which is not retried
+        await self._ensure_connected()
         try:
             await self._execute_position_locked(position)
         except BleakDBusError as ex:
@@ -342,6 +451,9 @@ class BLEBlind:
     @retry_bluetooth_connection_error(DEFAULT_ATTEMPTS)
     async def _get_position_locked(self) -> None:
         """Send command to device and read response."""
+        # Reconnects when an earlier attempt dropped the link, connection
+        # failures raise EstablishConnectionError which is not retried
+        await self._ensure_connected()
         try:
             await self._read_position_locked()
         except BleakDBusError as ex:
@@ -366,23 +478,44 @@ class BLEBlind:
 
 
     async def set_position(self, position: int):
-        await self._set_position(position)
-        self._fire_callbacks()
+        if (
+            position == self._position
+            and self._notifying
+            and (self._write_task is None or self._write_task.done())
+        ):
+            # Notifications keep the position current, nothing to move
+            return
+        # Coalesce rapid requests so only the latest target is written
+        self._pending_position = position
+        if self._write_task is None or self._write_task.done():
+            self._write_task = self.loop.create_task(
+                self._flush_position(), name=f"ble_blinds write {self.address}"
+            )
+        await asyncio.shield(self._write_task)
+
+    async def _flush_position(self) -> None:
+        """Write the latest requested position once requests settle."""
+        await asyncio.sleep(WRITE_COALESCE_DELAY)
+        while (position := self._pending_position) is not None:
+            self._pending_position = None
+            await self._set_position(position)
+            self._fire_callbacks()
 
     def _resolve_characteristics(self, services: BleakGATTServiceCollection) -> bool:
         """Resolve characteristics."""
-        if service := next((s for s in services if s.uuid == SERVICE_UUID), None):
-            if char := service.get_characteristic(POSITION_READ_UUID):
-                self._position_read_char = char
-            if char := service.get_characteristic(POSITION_WRITE_UUID):
-                self._position_write_char = char
+        if service := services.get_service(SERVICE_UUID):
+            self._position_read_char = service.get_characteristic(POSITION_READ_UUID)
+            self._position_write_char = service.get_characteristic(POSITION_WRITE_UUID)
         return bool(self._position_read_char and self._position_write_char)
 
     async def update(self):
-        await self._ensure_connected()
+        if self.notifying:
+            # Position changes are pushed to us, only keep the link alive
+            self._reset_disconnect_timer()
+            return
         await self._get_position()
 
-@dataclass
+@dataclass(slots=True)
 class BLEBlindData:
     title: str
     device: BLEBlind